@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import contextlib
 import re
 from copy import copy
 from dataclasses import asdict
@@ -41,6 +40,7 @@ if TYPE_CHECKING:
 __all__ = ("create_responses_for_handler",)
 
 CAPITAL_LETTERS_PATTERN = re.compile(r"(?=[A-Z])")
+HTTP_STATUSES = {status.value: status for status in HTTPStatus}
 
 
 def pascal_case_to_text(string: str) -> str:
@@ -278,6 +278,7 @@ def create_error_responses(exceptions: list[type[HTTPException]]) -> Iterator[tu
             grouped_exceptions[exc.status_code] = []
         grouped_exceptions[exc.status_code].append(exc)
     for status_code, exception_group in grouped_exceptions.items():
+        http_status = HTTP_STATUSES.get(status_code)
         exceptions_schemas = []
         group_description: str = ""
         for exc in exception_group:
@@ -286,9 +287,8 @@ def create_error_responses(exceptions: list[type[HTTPException]]) -> Iterator[tu
                 group_description = exc.detail
                 example_detail = exc.detail
 
-            if not example_detail:
-                with contextlib.suppress(Exception):
-                    example_detail = HTTPStatus(status_code).phrase
+            if not example_detail and http_status:
+                example_detail = http_status.phrase
 
             exceptions_schemas.append(
                 Schema(
@@ -311,9 +311,8 @@ def create_error_responses(exceptions: list[type[HTTPException]]) -> Iterator[tu
         else:
             schema = exceptions_schemas[0]
 
-        if not group_description:
-            with contextlib.suppress(Exception):
-                group_description = HTTPStatus(status_code).description
+        if not group_description and http_status:
+            group_description = http_status.description
 
         yield (
             str(status_code),
@@ -2,14 +2,14 @@ from __future__ import annotations
 
 from copy import copy
 from functools import partial
-from typing import TYPE_CHECKING, Any, Callable, Mapping, Sequence, cast
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Sequence, cast
 
 from litestar._signature import SignatureModel
 from litestar.di import Provide
 from litestar.dto import DTOData
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.plugins import DIPlugin, PluginRegistry
-from litestar.serialization import default_deserializer, default_serializer
+from litestar.serialization import default_deserializer, get_serializer
 from litestar.types import (
     Dependencies,
     Empty,
@@ -49,11 +49,14 @@ class BaseRouteHandler:
 
     __slots__ = (
         "_fn",
+        "_owner",
+        "_ownership_layers",
         "_parsed_data_field",
         "_parsed_fn_signature",
         "_parsed_return_field",
         "_resolved_data_dto",
         "_resolved_dependencies",
+        "_resolved_exception_handlers",
         "_resolved_guards",
         "_resolved_layered_parameters",
         "_resolved_return_dto",
@@ -68,7 +71,6 @@ class BaseRouteHandler:
         "middleware",
         "name",
         "opt",
-        "owner",
         "paths",
         "return_dto",
         "signature_namespace",
@@ -119,11 +121,13 @@ class BaseRouteHandler:
             type_encoders: A mapping of types to callables that transform them into types supported for serialization.
             **kwargs: Any additional kwarg - will be set in the opt dictionary.
         """
+        self._ownership_layers: tuple[Self | Controller | Router, ...] | EmptyType = Empty
         self._parsed_fn_signature: ParsedSignature | EmptyType = Empty
         self._parsed_return_field: FieldDefinition | EmptyType = Empty
         self._parsed_data_field: FieldDefinition | None | EmptyType = Empty
         self._resolved_data_dto: type[AbstractDTO] | None | EmptyType = Empty
         self._resolved_dependencies: dict[str, Provide] | EmptyType = Empty
+        self._resolved_exception_handlers: ExceptionHandlersMap | EmptyType = Empty
         self._resolved_guards: list[Guard] | EmptyType = Empty
         self._resolved_layered_parameters: dict[str, FieldDefinition] | EmptyType = Empty
         self._resolved_return_dto: type[AbstractDTO] | None | EmptyType = Empty
@@ -140,7 +144,7 @@ class BaseRouteHandler:
         self.name = name
         self.opt = dict(opt or {})
         self.opt.update(**kwargs)
-        self.owner: Controller | Router | None = None
+        self.owner = None
         self.return_dto = return_dto
         self.signature_namespace = add_types_to_signature_namespace(
             signature_types or [], dict(signature_namespace or {})
@@ -148,7 +152,7 @@ class BaseRouteHandler:
         self.type_decoders = type_decoders
         self.type_encoders = type_encoders
         self.paths = (
-            {normalize_path(p) for p in path} if path and isinstance(path, list) else {normalize_path(path or "/")}  # type: ignore[arg-type]
+            set(map(normalize_path, path)) if path and isinstance(path, list) else {normalize_path(path or "/")}  # type: ignore[arg-type]
         )
 
     def __call__(self, fn: AsyncAnyCallable) -> Self:
@@ -156,6 +160,24 @@ class BaseRouteHandler:
         self._fn = fn
         return self
 
+    def __copy__(self) -> Self:
+        """Return a shallow copy of the route handler.
+
+        Memoized values that refer to the route handler itself are not carried over, so the copy resolves them anew.
+        """
+        route_handler = object.__new__(type(self))
+        if hasattr(self, "__dict__"):
+            route_handler.__dict__.update(self.__dict__)
+        for cls in type(self).__mro__:
+            for slot in cls.__dict__.get("__slots__", ()):
+                try:
+                    setattr(route_handler, slot, getattr(self, slot))
+                except AttributeError:
+                    continue
+
+        route_handler._ownership_layers = Empty
+        return route_handler
+
     @property
     def handler_id(self) -> str:
         """A unique identifier used for generation of DTOs."""
@@ -179,7 +201,7 @@ class BaseRouteHandler:
             A default serializer for the route handler.
 
         """
-        return partial(default_serializer, type_encoders=self.resolve_type_encoders())
+        return get_serializer(self.resolve_type_encoders())
 
     @property
     def signature_model(self) -> type[SignatureModel]:
@@ -260,11 +282,26 @@ class BaseRouteHandler:
         return {name for layer in layered_dependencies for name in layer}  # pyright: ignore
 
     @property
-    def ownership_layers(self) -> list[Self | Controller | Router]:
+    def owner(self) -> Controller | Router | None:
+        """The layer that owns the route handler."""
+        return self._owner
+
+    @owner.setter
+    def owner(self, value: Controller | Router | None) -> None:
+        self._owner = value
+        self._ownership_layers = Empty
+
+    @property
+    def ownership_layers(self) -> tuple[Self | Controller | Router, ...]:
         """Return the handler layers from the app down to the route handler.
 
         ``app -> ... -> route handler``
+
+        The layers are memoized once the handler is registered on the app, at which point the ownership chain is final.
         """
+        if self._ownership_layers is not Empty:
+            return self._ownership_layers
+
         layers = []
 
         cur: Any = self
@@ -272,7 +309,7 @@ class BaseRouteHandler:
             layers.append(cur)
             cur = cur.owner
 
-        return list(reversed(layers))
+        return tuple(reversed(layers))
 
     @property
     def app(self) -> Litestar:
@@ -328,13 +365,13 @@ class BaseRouteHandler:
     def resolve_guards(self) -> list[Guard]:
         """Return all guards in the handlers scope, starting from highest to current layer."""
         if self._resolved_guards is Empty:
-            self._resolved_guards = []
-
-            for layer in self.ownership_layers:
-                self._resolved_guards.extend(layer.guards or [])  # pyright: ignore
-
             self._resolved_guards = cast(
-                "list[Guard]", [ensure_async_callable(guard) for guard in self._resolved_guards]
+                "list[Guard]",
+                [
+                    ensure_async_callable(guard)
+                    for layer in self.ownership_layers
+                    for guard in layer.guards or []  # pyright: ignore
+                ],
             )
 
         return self._resolved_guards
@@ -352,22 +389,40 @@ class BaseRouteHandler:
         plugin_registry = self._get_plugin_registry()
         if self._resolved_dependencies is Empty:
             self._resolved_dependencies = {}
+            dependency_keys: dict[Any, list[str]] = {}
             for layer in self.ownership_layers:
                 for key, provider in (layer.dependencies or {}).items():
                     self._resolved_dependencies[key] = self._resolve_dependency(
-                        key=key, provider=provider, plugin_registry=plugin_registry
+                        key=key, provider=provider, plugin_registry=plugin_registry, dependency_keys=dependency_keys
                     )
 
         return self._resolved_dependencies
 
     def _resolve_dependency(
-        self, key: str, provider: Provide | AnyCallable, plugin_registry: PluginRegistry | None
+        self,
+        key: str,
+        provider: Provide | AnyCallable,
+        plugin_registry: PluginRegistry | None,
+        dependency_keys: dict[Any, list[str]],
     ) -> Provide:
         if not isinstance(provider, Provide):
             provider = Provide(provider)
 
         if self._resolved_dependencies is not Empty:  # pragma: no cover
-            self._validate_dependency_is_unique(dependencies=self._resolved_dependencies, key=key, provider=provider)
+            self._validate_dependency_is_unique(
+                dependencies=self._resolved_dependencies,
+                key=key,
+                provider=provider,
+                dependency_keys=dependency_keys,
+            )
+            try:
+                keys = dependency_keys.setdefault(provider.dependency, [])
+            except TypeError:
+                # unhashable dependencies are not indexed, they are compared against all providers instead
+                pass
+            else:
+                if key not in keys:
+                    keys.append(key)
 
         if not getattr(provider, "parsed_fn_signature", None):
             dependency = unwrap_partial(provider.dependency)
@@ -396,23 +451,27 @@ class BaseRouteHandler:
     def resolve_middleware(self) -> list[Middleware]:
         """Build the middleware stack for the RouteHandler and return it.
 
-        The middlewares are added from top to bottom (``app -> router -> controller -> route handler``) and then
-        reversed.
+        The middlewares are collected from bottom to top (``route handler -> controller -> router -> app``), in
+        reverse order within each layer.
         """
-        resolved_middleware: list[Middleware] = []
-        for layer in self.ownership_layers:
-            resolved_middleware.extend(layer.middleware or [])  # pyright: ignore
-        return list(reversed(resolved_middleware))
+        return [
+            middleware
+            for layer in reversed(self.ownership_layers)
+            for middleware in reversed(layer.middleware or [])  # pyright: ignore
+        ]
 
     def resolve_exception_handlers(self) -> ExceptionHandlersMap:
         """Resolve the exception_handlers by starting from the route handler and moving up.
 
         This method is memoized so the computation occurs only once.
         """
-        resolved_exception_handlers: dict[int | type[Exception], ExceptionHandler] = {}
-        for layer in self.ownership_layers:
-            resolved_exception_handlers.update(layer.exception_handlers or {})  # pyright: ignore
-        return resolved_exception_handlers
+        if self._resolved_exception_handlers is Empty:
+            resolved_exception_handlers: dict[int | type[Exception], ExceptionHandler] = {}
+            for layer in self.ownership_layers:
+                resolved_exception_handlers.update(layer.exception_handlers or {})  # pyright: ignore
+            self._resolved_exception_handlers = resolved_exception_handlers
+
+        return self._resolved_exception_handlers
 
     def resolve_opts(self) -> None:
         """Build the route handler opt dictionary by going from top to bottom.
@@ -513,14 +572,30 @@ class BaseRouteHandler:
 
     async def authorize_connection(self, connection: ASGIConnection) -> None:
         """Ensure the connection is authorized by running all the route guards in scope."""
+        # guards receive a copy of the handler, so they cannot modify the handler itself. A single copy is shared by
+        # all guards of the connection.
+        guard_handler = copy(self)
         for guard in self.resolve_guards():
-            await guard(connection, copy(self))  # type: ignore[misc]
+            await guard(connection, guard_handler)  # type: ignore[misc]
 
     @staticmethod
-    def _validate_dependency_is_unique(dependencies: dict[str, Provide], key: str, provider: Provide) -> None:
-        """Validate that a given provider has not been already defined under a different key."""
-        for dependency_key, value in dependencies.items():
-            if provider == value:
+    def _validate_dependency_is_unique(
+        dependencies: dict[str, Provide], key: str, provider: Provide, dependency_keys: dict[Any, list[str]]
+    ) -> None:
+        """Validate that a given provider has not been already defined under a different key.
+
+        ``dependency_keys`` maps the dependency callables of the providers in ``dependencies`` to their keys.
+        Providers can only be equal if they wrap the same dependency, so only those are compared.
+        """
+        candidate_keys: Iterable[str]
+        try:
+            candidate_keys = dependency_keys.get(provider.dependency, ())
+        except TypeError:
+            # unhashable dependencies can't be indexed, so we have to compare against all providers
+            candidate_keys = dependencies
+
+        for dependency_key in candidate_keys:
+            if provider == dependencies.get(dependency_key):
                 raise ImproperlyConfiguredException(
                     f"Provider for key {key} is already defined under the different key {dependency_key}. "
                     f"If you wish to override a provider, it must have the same key."
@@ -535,6 +610,8 @@ class BaseRouteHandler:
         Returns:
             None
         """
+        self._ownership_layers = self.ownership_layers
+        self._resolved_exception_handlers = Empty
         self._validate_handler_function()
         self.resolve_dependencies()
         self.resolve_guards()
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from inspect import isawaitable
-from typing import TYPE_CHECKING, Any, Sequence, cast
+from inspect import isawaitable, isclass
+from typing import TYPE_CHECKING, Any, Awaitable, Sequence, cast
 
 from litestar.enums import HttpMethod
 from litestar.exceptions import ValidationException
 from litestar.response import Response
 from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT
-from litestar.types.builtin_types import NoneType
+from litestar.types.builtin_types import NoneType, UnionTypes
 
 if TYPE_CHECKING:
     from litestar.app import Litestar
@@ -24,6 +24,7 @@ __all__ = (
     "create_response_handler",
     "get_default_status_code",
     "is_empty_response_annotation",
+    "may_return_awaitable",
     "normalize_headers",
     "normalize_http_method",
 )
@@ -31,6 +32,7 @@ __all__ = (
 
 def create_data_handler(
     after_request: AfterRequestHookHandler | None,
+    await_data: bool,
     background: BackgroundTask | BackgroundTasks | None,
     cookies: frozenset[Cookie],
     headers: frozenset[ResponseHeader],
@@ -43,6 +45,7 @@ def create_data_handler(
 
     Args:
         after_request: An after request handler.
+        await_data: Whether the data may be an awaitable that has to be awaited first.
         background: A background task or background tasks.
         cookies: A set of pre-defined cookies.
         headers: A set of response headers.
@@ -56,13 +59,15 @@ def create_data_handler(
 
     """
 
+    normalized_headers = normalize_headers(headers)
+
     async def handler(
         data: Any,
         request: Request[Any, Any, Any],
         app: Litestar,
         **kwargs: Any,
     ) -> ASGIApp:
-        if isawaitable(data):
+        if await_data and isawaitable(data):
             data = await data
 
         response = response_class(
@@ -76,7 +81,7 @@ def create_data_handler(
         if after_request:
             response = await after_request(response)  # type: ignore[arg-type,misc]
 
-        return response.to_asgi_response(app=None, request=request, headers=normalize_headers(headers), cookies=cookies)  # pyright: ignore
+        return response.to_asgi_response(app=None, request=request, headers=normalized_headers, cookies=cookies)  # pyright: ignore
 
     return handler
 
@@ -178,7 +183,11 @@ def normalize_http_method(http_methods: HttpMethod | Method | Sequence[HttpMetho
         http_methods = [http_methods]  # pyright: ignore
 
     for method in http_methods:
-        method_name = method.value.upper() if isinstance(method, HttpMethod) else method.upper()
+        if isinstance(method, HttpMethod):
+            # enum members are upper-case and valid by construction, no need to validate them again
+            output.add(method.value)
+            continue
+        method_name = method.upper()
         if method_name not in HTTP_METHOD_NAMES:
             raise ValidationException(f"Invalid HTTP method: {method_name}")
         output.add(method_name)
@@ -216,4 +225,28 @@ def is_empty_response_annotation(return_annotation: FieldDefinition) -> bool:
     )
 
 
+def may_return_awaitable(return_annotation: FieldDefinition) -> bool:
+    """Return whether a handler annotated with the given return annotation may return an awaitable.
+
+    Anything that is not a concrete, non-awaitable class (e.g. ``Any`` or a type variable) is assumed to possibly be
+    an awaitable.
+
+    Args:
+        return_annotation: A return annotation.
+
+    Returns:
+        Whether the return value of the handler may be an awaitable.
+    """
+    if return_annotation.is_any:
+        return True
+
+    if return_annotation.origin in UnionTypes:
+        return any(may_return_awaitable(inner_type) for inner_type in return_annotation.inner_types)
+
+    target = return_annotation.origin or return_annotation.annotation
+    if target is None:
+        return False
+    return not isclass(target) or issubclass(target, Awaitable)
+
+
 HTTP_METHOD_NAMES = {m.value for m in HttpMethod}
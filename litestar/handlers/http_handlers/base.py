@@ -19,6 +19,7 @@ from litestar.handlers.http_handlers._utils import (
     create_response_handler,
     get_default_status_code,
     is_empty_response_annotation,
+    may_return_awaitable,
     normalize_http_method,
 )
 from litestar.openapi.spec import Operation
@@ -74,6 +75,7 @@ class HTTPRouteHandler(BaseRouteHandler):
     """
 
     __slots__ = (
+        "_resolved_after_request",
         "_resolved_after_response",
         "_resolved_before_request",
         "_resolved_include_in_schema",
@@ -295,6 +297,7 @@ class HTTPRouteHandler(BaseRouteHandler):
         self.security = security
         self.responses = responses
         # memoized attributes, defaulted to Empty
+        self._resolved_after_request: AsyncAnyCallable | None | EmptyType = Empty
         self._resolved_after_response: AsyncAnyCallable | None | EmptyType = Empty
         self._resolved_before_request: AsyncAnyCallable | None | EmptyType = Empty
         self._response_handler_mapping: ResponseHandlerMap = {"default_handler": Empty, "response_type_handler": Empty}
@@ -316,6 +319,36 @@ class HTTPRouteHandler(BaseRouteHandler):
         super().__call__(fn)
         return self
 
+    def _resolve_layered_attributes(self) -> None:
+        """Resolve the request-time attributes for which the value closest to the route handler takes precedence.
+
+        These attributes are all needed once the first request reaches the route handler, so the ownership layers are
+        traversed only once to resolve them and the results are memoized.
+        """
+        request_class: type[Request] | None = None
+        response_class: type[Response] | None = None
+        before_request: AsyncAnyCallable | None = None
+        after_request: AsyncAnyCallable | None = None
+        request_max_body_size: int | None | EmptyType = Empty
+
+        for layer in reversed(self.ownership_layers):
+            if request_class is None:
+                request_class = layer.request_class
+            if response_class is None:
+                response_class = layer.response_class
+            if before_request is None:
+                before_request = layer.before_request or None
+            if after_request is None:
+                after_request = layer.after_request or None  # type: ignore[assignment]
+            if request_max_body_size is Empty:
+                request_max_body_size = layer.request_max_body_size
+
+        self._resolved_request_class = request_class or Request
+        self._resolved_response_class = response_class or Response
+        self._resolved_before_request = before_request
+        self._resolved_after_request = after_request
+        self._resolved_request_max_body_size = request_max_body_size
+
     def resolve_request_class(self) -> type[Request]:
         """Return the closest custom Request class in the owner graph or the default Request class.
 
@@ -324,12 +357,8 @@ class HTTPRouteHandler(BaseRouteHandler):
         Returns:
             The default :class:`Request <.connection.Request>` class for the route handler.
         """
-
         if self._resolved_request_class is Empty:
-            self._resolved_request_class = next(
-                (layer.request_class for layer in reversed(self.ownership_layers) if layer.request_class is not None),
-                Request,
-            )
+            self._resolve_layered_attributes()
 
         return cast("type[Request]", self._resolved_request_class)
 
@@ -342,10 +371,7 @@ class HTTPRouteHandler(BaseRouteHandler):
             The default :class:`Response <.response.Response>` class for the route handler.
         """
         if self._resolved_response_class is Empty:
-            self._resolved_response_class = next(
-                (layer.response_class for layer in reversed(self.ownership_layers) if layer.response_class is not None),
-                Response,
-            )
+            self._resolve_layered_attributes()
 
         return cast("type[Response]", self._resolved_response_class)
 
@@ -406,10 +432,22 @@ class HTTPRouteHandler(BaseRouteHandler):
             An optional :class:`before request lifecycle hook handler <.types.BeforeRequestHookHandler>`
         """
         if self._resolved_before_request is Empty:
-            before_request_handlers = [layer.before_request for layer in self.ownership_layers if layer.before_request]
-            self._resolved_before_request = before_request_handlers[-1] if before_request_handlers else None
+            self._resolve_layered_attributes()
         return cast("AsyncAnyCallable | None", self._resolved_before_request)
 
+    def resolve_after_request(self) -> AsyncAnyCallable | None:
+        """Resolve the after_request handler by starting from the route handler and moving up.
+
+        If a handler is found it is returned, otherwise None is set.
+        This method is memoized so the computation occurs only once.
+
+        Returns:
+            An optional :class:`after request lifecycle hook handler <.types.AfterRequestHookHandler>`
+        """
+        if self._resolved_after_request is Empty:
+            self._resolve_layered_attributes()
+        return cast("AsyncAnyCallable | None", self._resolved_after_request)
+
     def resolve_after_response(self) -> AsyncAnyCallable | None:
         """Resolve the after_response handler by starting from the route handler and moving up.
 
@@ -484,14 +522,8 @@ class HTTPRouteHandler(BaseRouteHandler):
         if (resolved_limits := self._resolved_request_max_body_size) is not Empty:
             return resolved_limits
 
-        max_body_size = self._resolved_request_max_body_size = next(  # pyright: ignore
-            (
-                max_body_size
-                for layer in reversed(self.ownership_layers)
-                if (max_body_size := layer.request_max_body_size) is not Empty
-            ),
-            Empty,
-        )
+        self._resolve_layered_attributes()
+        max_body_size = self._resolved_request_max_body_size
         if max_body_size is Empty:
             raise ImproperlyConfiguredException(
                 "'request_max_body_size' set to 'Empty' on all layers. To omit a limit, "
@@ -511,15 +543,7 @@ class HTTPRouteHandler(BaseRouteHandler):
             Async Callable to handle an HTTP Request
         """
         if self._response_handler_mapping["default_handler"] is Empty:
-            after_request_handlers: list[AsyncAnyCallable] = [
-                layer.after_request  # type: ignore[misc]
-                for layer in self.ownership_layers
-                if layer.after_request
-            ]
-            after_request = cast(
-                "AfterRequestHookHandler | None",
-                after_request_handlers[-1] if after_request_handlers else None,
-            )
+            after_request = cast("AfterRequestHookHandler | None", self.resolve_after_request())
 
             media_type = self.media_type.value if isinstance(self.media_type, Enum) else self.media_type
             response_class = self.resolve_response_class()
@@ -549,6 +573,7 @@ class HTTPRouteHandler(BaseRouteHandler):
             else:
                 self._response_handler_mapping["default_handler"] = create_data_handler(
                     after_request=after_request,
+                    await_data=is_async_callable(self.fn) or may_return_awaitable(return_type),
                     background=self.background,
                     cookies=cookies,
                     headers=headers,
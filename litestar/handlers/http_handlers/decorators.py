@@ -61,6 +61,8 @@ class delete(HTTPRouteHandler):
     Use this decorator to decorate an HTTP handler for DELETE requests.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | None | Sequence[str] = None,
@@ -236,6 +238,8 @@ class get(HTTPRouteHandler):
     Use this decorator to decorate an HTTP handler for GET requests.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | None | Sequence[str] = None,
@@ -412,6 +416,8 @@ class head(HTTPRouteHandler):
     Use this decorator to decorate an HTTP handler for HEAD requests.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | None | Sequence[str] = None,
@@ -607,6 +613,8 @@ class patch(HTTPRouteHandler):
     Use this decorator to decorate an HTTP handler for PATCH requests.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | None | Sequence[str] = None,
@@ -786,6 +794,8 @@ class post(HTTPRouteHandler):
     Use this decorator to decorate an HTTP handler for POST requests.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | None | Sequence[str] = None,
@@ -965,6 +975,8 @@ class put(HTTPRouteHandler):
     Use this decorator to decorate an HTTP handler for PUT requests.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | None | Sequence[str] = None,
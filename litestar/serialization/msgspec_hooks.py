@@ -80,8 +80,22 @@ def default_serializer(value: Any, type_encoders: Mapping[Any, Callable[[Any], A
     Raises:
         TypeError: if value is not supported
     """
-    type_encoders = {**DEFAULT_TYPE_ENCODERS, **(type_encoders or {})}
+    return _serialize_with_type_encoders(
+        value, {**DEFAULT_TYPE_ENCODERS, **type_encoders} if type_encoders else DEFAULT_TYPE_ENCODERS
+    )
 
+
+def _serialize_with_type_encoders(value: Any, type_encoders: Mapping[Any, Callable[[Any], Any]]) -> Any:
+    """Transform values non-natively supported by ``msgspec`` using an already merged mapping of type encoders.
+
+    Args:
+        value: A value to serialized
+        type_encoders: Mapping of types to callables to transforming types, including the default type encoders
+    Returns:
+        A serialized value
+    Raises:
+        TypeError: if value is not supported
+    """
     for base in value.__class__.__mro__[:-1]:
         try:
             encoder = type_encoders[base]
@@ -293,9 +307,12 @@ def decode_msgpack(  # type: ignore[misc]
 
 
 def get_serializer(type_encoders: TypeEncodersMap | None = None) -> Serializer:
-    """Get the serializer for the given type encoders."""
+    """Get the serializer for the given type encoders.
+
+    The type encoders are merged with the default type encoders once, instead of for every serialized value.
+    """
 
     if type_encoders:
-        return partial(default_serializer, type_encoders=type_encoders)
+        return partial(_serialize_with_type_encoders, type_encoders={**DEFAULT_TYPE_ENCODERS, **type_encoders})
 
     return default_serializer
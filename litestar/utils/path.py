@@ -18,9 +18,9 @@ def normalize_path(path: str) -> str:
     Returns:
         Path string
     """
-    path = path.strip("/")
-    path = f"/{path}"
-    return multi_slash_pattern.sub("/", path)
+    path = f"/{path.strip('/')}"
+    # this runs for every request, so avoid the substitution for paths without repeated slashes
+    return multi_slash_pattern.sub("/", path) if "//" in path else path
 
 
 def join_paths(paths: Iterable[str]) -> str:
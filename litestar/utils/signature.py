@@ -4,9 +4,10 @@ import sys
 import typing
 from copy import deepcopy
 from dataclasses import dataclass, replace
-from inspect import Signature, getmembers, isclass, ismethod
+from inspect import Signature, getmembers, isclass, isfunction, ismethod
 from itertools import chain
 from typing import TYPE_CHECKING, Any, Union
+from weakref import WeakKeyDictionary
 
 from typing_extensions import Annotated, Self, get_args, get_origin, get_type_hints
 
@@ -31,6 +32,7 @@ else:
 __all__ = (
     "ParsedSignature",
     "add_types_to_signature_namespace",
+    "get_fn_signature",
     "get_fn_type_hints",
     "merge_signature_namespaces",
 )
@@ -175,6 +177,33 @@ def get_fn_type_hints(fn: Any, namespace: dict[str, Any] | None = None) -> dict[
     return hints
 
 
+_signature_cache: WeakKeyDictionary[Any, Signature] = WeakKeyDictionary()
+
+
+def get_fn_signature(fn: AnyCallable) -> Signature:
+    """Return the :class:`inspect.Signature` of ``fn``.
+
+    Signatures of plain functions are memoized, so a function that is parsed more than once (e.g. a dependency shared
+    across many route handlers) is only inspected once. The cache holds weak references only and does not keep the
+    functions alive. Other callables, such as partials, bound methods or classes, are inspected on every call.
+
+    Notes:
+        - Changes made to a function's annotations after it has been parsed for the first time are not reflected.
+
+    Args:
+        fn: Any callable.
+
+    Returns:
+        The signature of ``fn``.
+    """
+    if not isfunction(fn):
+        return Signature.from_callable(fn)
+
+    if (signature := _signature_cache.get(fn)) is None:
+        signature = _signature_cache[fn] = Signature.from_callable(fn)
+    return signature
+
+
 @dataclass(frozen=True)
 class ParsedSignature:
     """Parsed signature.
@@ -211,7 +240,7 @@ class ParsedSignature:
         Returns:
             ParsedSignature
         """
-        signature = Signature.from_callable(fn)
+        signature = get_fn_signature(fn)
         fn_type_hints = get_fn_type_hints(fn, namespace=signature_namespace)
         expanded_type_hints = expand_type_var_in_type_hint(fn_type_hints, signature_namespace)
 
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -9,6 +9,7 @@ from litestar.response.base import ASGIResponse
 from litestar.status_codes import HTTP_200_OK, HTTP_403_FORBIDDEN
 from litestar.testing import create_test_client
 from litestar.types import Receive, Scope, Send
+from litestar.utils.sync import AsyncCallable
 
 if TYPE_CHECKING:
     from litestar.connection import ASGIConnection
@@ -107,3 +108,44 @@ def test_guards_layering_for_same_route_handler() -> None:
         )
         == 3
     )
+
+
+def test_guards_receive_copy_of_route_handler() -> None:
+    received_handlers: list[BaseRouteHandler] = []
+    received_opts: list[dict[str, Any]] = []
+
+    def guard(_: "ASGIConnection", route_handler: "BaseRouteHandler") -> None:
+        received_handlers.append(route_handler)
+        received_opts.append(route_handler.opt)
+        route_handler.opt = {"modified": True}
+
+    @get(path="/", guards=[guard, guard], opt={"modified": False})
+    def handler() -> None: ...
+
+    with create_test_client(route_handlers=[handler]) as client:
+        assert client.get("/").status_code == HTTP_200_OK
+        assert client.get("/").status_code == HTTP_200_OK
+
+    route_handler = client.app.route_handler_method_map["/"]["GET"]
+    assert len(received_handlers) == 4
+    # guards of the same connection share a copy, each connection receives a fresh one
+    assert received_handlers[0] is received_handlers[1]
+    assert received_handlers[2] is received_handlers[3]
+    assert received_handlers[0] is not received_handlers[2]
+    assert all(received is not route_handler for received in received_handlers)
+    assert all(received.fn is route_handler.fn for received in received_handlers)
+    # rebinding attributes of the copy does not leak into the handler or later connections
+    assert received_opts == [{"modified": False}, {"modified": True}, {"modified": False}, {"modified": True}]
+    assert route_handler.opt == {"modified": False}
+
+
+def test_resolve_guards_normalizes_sync_guards_once() -> None:
+    @get(path="/", guards=[local_guard, router_guard])
+    def handler() -> None: ...
+
+    resolved_guards = handler.resolve_guards()
+
+    assert resolved_guards[0] is local_guard
+    assert isinstance(resolved_guards[1], AsyncCallable)
+    assert resolved_guards[1].func is router_guard
+    assert handler.resolve_guards() is resolved_guards
@@ -1,7 +1,9 @@
+from copy import copy
 from typing import Awaitable, Callable
 
-from litestar import Controller, Litestar, Router, get
+from litestar import Controller, Litestar, Request, Response, Router, get
 from litestar.di import Provide
+from litestar.types import ASGIApp
 
 
 def test_resolve_dependencies_without_provide() -> None:
@@ -67,3 +69,84 @@ def test_resolve_dependencies_cached() -> None:
 
     assert handler.resolve_dependencies() is handler.resolve_dependencies()
     assert handler_2.resolve_dependencies() is handler_2.resolve_dependencies()
+
+
+def test_ownership_layers_memoized_on_registration() -> None:
+    @get("/handler", name="foo")
+    async def handler() -> None:
+        pass
+
+    router = Router("/router", route_handlers=[handler])
+    app = Litestar([router], openapi_config=None)
+
+    registered_handler = app.get_handler_index_by_name("foo")["handler"]  # type: ignore[index]
+    layers = registered_handler.ownership_layers
+
+    assert layers[0] is app
+    assert layers[-1] is registered_handler
+    assert registered_handler.ownership_layers is layers
+
+    registered_handler.owner = None
+    assert registered_handler.ownership_layers == (registered_handler,)
+
+
+def test_copy_of_registered_handler_resolves_own_ownership_layers() -> None:
+    @get("/handler", name="foo")
+    async def handler() -> None:
+        pass
+
+    router = Router("/router", route_handlers=[handler])
+    app = Litestar([router], openapi_config=None)
+
+    registered_handler = app.get_handler_index_by_name("foo")["handler"]  # type: ignore[index]
+    handler_copy = copy(registered_handler)
+
+    assert handler_copy.ownership_layers[-1] is handler_copy
+    assert handler_copy.ownership_layers[:-1] == registered_handler.ownership_layers[:-1]
+    assert registered_handler.ownership_layers[-1] is registered_handler
+
+
+def test_resolve_exception_handlers_memoized() -> None:
+    def app_exception_handler(request: Request, exc: Exception) -> Response:
+        return Response(content=None)
+
+    def handler_exception_handler(request: Request, exc: Exception) -> Response:
+        return Response(content=None)
+
+    @get("/", name="foo", exception_handlers={ValueError: handler_exception_handler})
+    async def handler() -> None:
+        pass
+
+    app = Litestar([handler], exception_handlers={RuntimeError: app_exception_handler}, openapi_config=None)
+    registered_handler = app.get_handler_index_by_name("foo")["handler"]  # type: ignore[index]
+
+    exception_handlers = registered_handler.resolve_exception_handlers()
+    assert exception_handlers[RuntimeError] is app_exception_handler
+    assert exception_handlers[ValueError] is handler_exception_handler
+    assert registered_handler.resolve_exception_handlers() is exception_handlers
+
+
+def test_resolve_middleware_order() -> None:
+    def middleware_factory() -> Callable[[ASGIApp], ASGIApp]:
+        def middleware(app: ASGIApp) -> ASGIApp:
+            return app
+
+        return middleware
+
+    app_middleware = [middleware_factory(), middleware_factory()]
+    router_middleware = [middleware_factory()]
+    handler_middleware = [middleware_factory(), middleware_factory()]
+
+    @get("/handler", name="foo", middleware=handler_middleware)
+    async def handler() -> None:
+        pass
+
+    router = Router("/router", route_handlers=[handler], middleware=router_middleware)
+    app = Litestar([router], middleware=app_middleware, openapi_config=None)
+    registered_handler = app.get_handler_index_by_name("foo")["handler"]  # type: ignore[index]
+
+    assert registered_handler.resolve_middleware() == [
+        *reversed(handler_middleware),
+        *reversed(router_middleware),
+        *reversed(app_middleware),
+    ]
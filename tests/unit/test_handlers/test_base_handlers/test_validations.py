@@ -2,7 +2,8 @@ from dataclasses import dataclass
 
 import pytest
 
-from litestar import Litestar, post
+from litestar import Litestar, get, post
+from litestar.di import Provide
 from litestar.dto import DTOData
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.handlers.base import BaseRouteHandler
@@ -29,3 +30,24 @@ def test_dto_data_annotation_with_no_resolved_dto() -> None:
 
     with pytest.raises(ImproperlyConfiguredException):
         Litestar(route_handlers=[async_hello_world])
+
+
+def test_dependency_provider_defined_under_different_keys() -> None:
+    async def provide_value() -> int:
+        return 1
+
+    async def provide_other_value() -> int:
+        return 2
+
+    @get("/", dependencies={"first": Provide(provide_value), "other": Provide(provide_other_value)})
+    async def handler(first: int, other: int) -> None:
+        pass
+
+    with pytest.raises(ImproperlyConfiguredException, match="already defined under the different key second"):
+        Litestar(route_handlers=[handler], dependencies={"second": Provide(provide_value)})
+
+    @get("/", dependencies={"first": Provide(provide_other_value)})
+    async def overriding_handler(first: int) -> None:
+        pass
+
+    Litestar(route_handlers=[overriding_handler], dependencies={"first": Provide(provide_value)})
@@ -1,6 +1,6 @@
 import pytest
 
-from litestar import Controller, Litestar, Router, post
+from litestar import Controller, Litestar, Request, Response, Router, post
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.types import Empty
 
@@ -64,3 +64,31 @@ def test_resolve_request_max_body_size_empty_on_all_layers_raises() -> None:
 
     with pytest.raises(ImproperlyConfiguredException):
         handler_two.resolve_request_max_body_size()
+
+
+def test_resolve_layered_attributes() -> None:
+    async def router_hook(request: Request) -> None:
+        pass
+
+    async def handler_hook(response: Response) -> Response:
+        return response
+
+    class RouterRequest(Request):
+        pass
+
+    class HandlerResponse(Response):
+        pass
+
+    @post("/", after_request=handler_hook, response_class=HandlerResponse)
+    def handler() -> None:
+        pass
+
+    router = Router("/", route_handlers=[handler], before_request=router_hook, request_class=RouterRequest)
+    app = Litestar([router])
+    route_handler = app.route_handler_method_map["/"]["POST"]
+
+    assert route_handler.resolve_request_class() is RouterRequest  # type: ignore[union-attr]
+    assert route_handler.resolve_response_class() is HandlerResponse  # type: ignore[union-attr]
+    assert route_handler.resolve_before_request() is router.before_request  # type: ignore[union-attr]
+    assert route_handler.resolve_after_request() is route_handler.after_request  # type: ignore[union-attr]
+    assert route_handler.resolve_request_max_body_size() == app.request_max_body_size  # type: ignore[union-attr]
@@ -1,3 +1,5 @@
+from typing import Any, Awaitable, Callable
+
 import pytest
 
 from litestar import MediaType, get
@@ -31,3 +33,22 @@ def test_async_callable_with_sync_to_thread_warns(sync_to_thread: bool) -> None:
         @get(sync_to_thread=sync_to_thread)
         async def handler() -> None:
             pass
+
+
+async def get_value() -> str:
+    return "Hello World"
+
+
+def sync_handler_returning_awaitable() -> Awaitable[str]:
+    return get_value()
+
+
+def sync_handler_returning_any() -> Any:
+    return get_value()
+
+
+@pytest.mark.parametrize("handler", [sync_handler_returning_awaitable, sync_handler_returning_any])
+def test_sync_handler_returning_awaitable(handler: Callable[[], Any]) -> None:
+    with create_test_client(get("/", media_type=MediaType.TEXT, sync_to_thread=False)(handler)) as client:
+        response = client.get("/")
+        assert response.text == "Hello World"
@@ -1,4 +1,4 @@
-from pathlib import PurePosixPath
+from pathlib import PurePath, PurePosixPath
 from typing import Any, Optional
 
 import pytest
@@ -204,6 +204,17 @@ def test_get_serializer() -> None:
     )
 
 
+def test_get_serializer_merges_default_type_encoders_once() -> None:
+    class Foo:
+        pass
+
+    serializer = get_serializer(type_encoders={Foo: lambda f: "it's a foo"})
+
+    assert serializer(Foo()) == "it's a foo"
+    assert serializer(PurePosixPath("/foo")) == "/foo"
+    assert set(serializer.keywords["type_encoders"]) >= {Foo, PurePath}  # type: ignore[attr-defined]
+
+
 def test_head_response_doesnt_support_content() -> None:
     with pytest.raises(ImproperlyConfiguredException):
         ASGIResponse(body=b"hello world", media_type=MediaType.TEXT, is_head_response=True)
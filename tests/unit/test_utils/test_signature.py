@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import gc
 import inspect
 import warnings
+import weakref
+from functools import partial
 from inspect import Parameter
 from types import ModuleType
 from typing import Any, Callable, Generic, List, Optional, TypeVar, Union
@@ -20,7 +23,12 @@ from litestar.types.asgi_types import Receive, Scope, Send
 from litestar.types.builtin_types import NoneType
 from litestar.types.empty import Empty
 from litestar.typing import FieldDefinition
-from litestar.utils.signature import ParsedSignature, add_types_to_signature_namespace, get_fn_type_hints
+from litestar.utils.signature import (
+    ParsedSignature,
+    add_types_to_signature_namespace,
+    get_fn_signature,
+    get_fn_type_hints,
+)
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -152,6 +160,31 @@ def test_parsed_signature() -> None:
     assert parsed_sig.original_signature == inspect.signature(fn)
 
 
+def test_get_fn_signature() -> None:
+    def fn(foo: int) -> None: ...
+
+    class UnhashableCallable:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, foo: int) -> None: ...
+
+    assert get_fn_signature(fn) is get_fn_signature(fn)
+    assert get_fn_signature(fn) == inspect.signature(fn)
+    assert get_fn_signature(UnhashableCallable()) == inspect.signature(UnhashableCallable())
+    assert get_fn_signature(partial(fn, foo=1)) == inspect.signature(partial(fn, foo=1))
+
+
+def test_get_fn_signature_does_not_keep_functions_alive() -> None:
+    def fn(foo: int) -> None: ...
+
+    fn_ref = weakref.ref(fn)
+    get_fn_signature(fn)
+    del fn
+    gc.collect()
+
+    assert fn_ref() is None
+
+
 def test_add_types_to_signature_namespace() -> None:
     """Test add_types_to_signature_namespace."""
     ns = add_types_to_signature_namespace([int, str], {})